@@ -76,7 +76,11 @@ const updateServicesWithNewConfig = async (configuration: any): Promise<void> =>
       global.campaignService.updateApiKeys(elevenLabsKey, openAIKey, anthropicKey);
       logger.info('Campaign service updated with new API keys');
     }
-    
+
+    // Shared voice AI instance caches LLM providers, so rebuild it on next use
+    const { resetSharedVoiceAIService } = require('../services/enhancedVoiceAIService');
+    resetSharedVoiceAIService();
+
     logger.info('All services updated with new configuration');
   } catch (error) {
     logger.error(`Error updating services with new config: ${getErrorMessage(error)}`);
@@ -4,7 +4,7 @@ import { logger } from '../index';
 import Call from '../models/Call';
 import Configuration from '../models/Configuration';
 import { conversationEngine } from '../services/index';
-import { EnhancedVoiceAIService } from '../services/enhancedVoiceAIService';
+import { getSharedVoiceAIService } from '../services/enhancedVoiceAIService';
 import { getSDKService } from '../services/elevenlabsSDKService';
 import { handleVoiceStream } from './streamController';
 import responseCache from '../utils/responseCache';
@@ -172,7 +172,7 @@ export const handleOptimizedVoiceStream = async (ws: WebSocket, req: Request): P
     }
     
     // Initialize Enhanced Voice AI service as well (for compatibility)
-    voiceAI = new EnhancedVoiceAIService(
+    voiceAI = getSharedVoiceAIService(
       config.elevenLabsConfig.apiKey
     );
     
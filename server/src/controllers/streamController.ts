@@ -4,7 +4,7 @@ import { logger } from '../index';
 import Call from '../models/Call';
 import Configuration from '../models/Configuration';
 import { conversationEngine } from '../services/index';
-import { EnhancedVoiceAIService } from '../services/enhancedVoiceAIService';
+import { EnhancedVoiceAIService, getSharedVoiceAIService } from '../services/enhancedVoiceAIService';
 import { v4 as uuidv4 } from 'uuid';
 
 /**
@@ -74,7 +74,7 @@ export const handleVoiceStream = async (ws: WebSocket, req: Request): Promise<vo
     }
     
     // Initialize ElevenLabs for voice synthesis
-    voiceAI = new EnhancedVoiceAIService(
+    voiceAI = getSharedVoiceAIService(
       config.elevenLabsConfig.apiKey
     );
     
@@ -356,7 +356,7 @@ export const handleConversationalAIStream = async (ws: WebSocket, req: Request):
     }
     
     // Create voice AI service instance
-    voiceAI = new EnhancedVoiceAIService(
+    voiceAI = getSharedVoiceAIService(
       config.elevenLabsConfig.apiKey
     );
     
@@ -266,8 +266,13 @@ export function registerTranscriptionRoutes(
       const recentJobs = await redisClient.lRange('transcription:recent_jobs', 0, 9);
       const jobDetails = [];
       
-      for (const jobId of recentJobs) {
-        const job = await redisClient.hGetAll(`job:${jobId}`);
+      // Fetch all job hashes concurrently rather than one round trip at a time
+      const jobs = await Promise.all(
+        recentJobs.map((jobId: string) => redisClient.hGetAll(`job:${jobId}`))
+      );
+      
+      recentJobs.forEach((jobId: string, index: number) => {
+        const job = jobs[index];
         if (job && Object.keys(job).length > 0) {
           jobDetails.push({
             jobId,
@@ -277,7 +282,7 @@ export function registerTranscriptionRoutes(
             processingTime: job.processingTime || null
           });
         }
-      }
+      });
       
       return {
         activeWorkers,
@@ -2,6 +2,7 @@ import { createClient, DeepgramClient, LiveTranscriptionEvents } from '@deepgram
 import { getErrorMessage } from '../utils/logger';
 import logger from '../utils/logger';
 import { EventEmitter } from 'events';
+import * as crypto from 'crypto';
 import { v4 as uuidv4 } from 'uuid';
 import Configuration from '../models/Configuration';
 import { getCircuitBreakerService, CircuitBreakerOptions } from './circuitBreakerService';
@@ -73,8 +74,9 @@ export class DeepgramService extends EventEmitter {
   };
   private readonly CIRCUIT_NAME = 'deepgram-api';
   private fallbackProviders: string[] = [];
-  // Local cache for transcription results
+  // Local LRU cache for transcription results (Map keeps insertion order)
   private transcriptionCache: Map<string, any> = new Map();
+  private readonly MAX_CACHE_ENTRIES = 500;
 
   /**
    * Create a new Deepgram Service instance
@@ -162,9 +164,16 @@ export class DeepgramService extends EventEmitter {
         };
 
         // Try to get cached result first if available
-        const cacheKey = `transcribe:${Buffer.from(audioBuffer).toString('base64').slice(0, 50)}:${JSON.stringify(transcriptionOptions)}`;
+        // Hash the raw audio bytes instead of base64-encoding the whole buffer
+        const cacheKey = crypto.createHash('sha1')
+          .update(audioBuffer)
+          .update(JSON.stringify(transcriptionOptions))
+          .digest('hex');
         const cachedResult = this.transcriptionCache.get(cacheKey);
         if (cachedResult) {
+          // Re-insert to mark as most recently used
+          this.transcriptionCache.delete(cacheKey);
+          this.transcriptionCache.set(cacheKey, cachedResult);
           logger.info('Using cached transcription result');
           return cachedResult.data;
         }
@@ -199,6 +208,13 @@ export class DeepgramService extends EventEmitter {
           data: transcriptionResult,
           timestamp: Date.now()
         });
+        if (this.transcriptionCache.size > this.MAX_CACHE_ENTRIES) {
+          // Evict the least recently used entry
+          const oldestKey = this.transcriptionCache.keys().next().value;
+          if (oldestKey !== undefined) {
+            this.transcriptionCache.delete(oldestKey);
+          }
+        }
         
         return transcriptionResult;
       } catch (error) {
@@ -11,6 +11,7 @@ import { EventEmitter } from 'events';
 import { v4 as uuidv4 } from 'uuid';
 import logger from '../utils/logger';
 import { getErrorMessage } from '../utils/logger';
+import { keepAliveHttpsAgent } from '../utils/httpAgent';
 import { VoicePersonality } from './voiceAIService';
 // Import the official ElevenLabs SDK
 import ElevenLabs from 'elevenlabs-node';
@@ -211,7 +212,8 @@ export class ElevenLabsConversationalService extends EventEmitter {
               'xi-api-key': this.apiKey
             },
             responseType: 'arraybuffer',
-            timeout: 30000 // 30 second timeout
+            timeout: 30000, // 30 second timeout
+            httpsAgent: keepAliveHttpsAgent
           }
         );
 
@@ -229,18 +231,21 @@ export class ElevenLabsConversationalService extends EventEmitter {
           // outside the 2xx range
           let errorData = axiosError.response.data;
           
-          // Try to parse the error data if it's in arraybuffer format
+          // Decode arraybuffer error bodies once, capped at 512 bytes. ElevenLabs
+          // errors are small JSON; anything larger (e.g. proxy HTML) is truncated
+          // instead of being stringified byte by byte
           if (errorData instanceof ArrayBuffer || Buffer.isBuffer(errorData)) {
+            const dataString = Buffer.from(errorData).toString('utf8', 0, 512);
             try {
-              const dataString = Buffer.from(errorData).toString('utf8');
               errorData = JSON.parse(dataString);
-              logger.error(`ElevenLabs API error response: ${JSON.stringify(errorData)}`);
             } catch (e) {
-              logger.error(`Could not parse error response: ${e.message}`);
+              errorData = dataString;
             }
           }
           
-          throw new Error(`ElevenLabs API responded with ${axiosError.response.status}: ${JSON.stringify(errorData)}`);
+          const errorDetails = typeof errorData === 'string' ? errorData : JSON.stringify(errorData);
+          logger.error(`ElevenLabs API error response: ${errorDetails}`);
+          throw new Error(`ElevenLabs API responded with ${axiosError.response.status}: ${errorDetails}`);
         } else if (axiosError.request) {
           // The request was made but no response was received
           throw new Error(`No response received from ElevenLabs API: ${axiosError.message}`);
@@ -125,13 +125,20 @@ export class EnhancedSpeechToTextService {
     'asia': 'api-asia.deepgram.com'
   };
   private selectedRegion: string = 'us-east';
+  private static readonly LATENCY_WINDOW = 100;
   private networkMetrics: {
-    latencies: number[];
+    latencies: Float64Array; // Ring buffer of the last LATENCY_WINDOW measurements
+    latencyIndex: number;
+    latencyCount: number;
+    latencySum: number;
     errors: number;
     reconnects: number;
     totalRequests: number;
   } = {
-    latencies: [],
+    latencies: new Float64Array(EnhancedSpeechToTextService.LATENCY_WINDOW),
+    latencyIndex: 0,
+    latencyCount: 0,
+    latencySum: 0,
     errors: 0,
     reconnects: 0,
     totalRequests: 0
@@ -176,8 +183,10 @@ export class EnhancedSpeechToTextService {
       const now = Date.now();
       const expiryTime = now - 86400000; // 24 hours ago
       
-      await this.cleanupDirectory(this.tempDir, expiryTime);
-      await this.cleanupDirectory(this.cacheDir, expiryTime);
+      await Promise.all([
+        this.cleanupDirectory(this.tempDir, expiryTime),
+        this.cleanupDirectory(this.cacheDir, expiryTime)
+      ]);
       
       logger.debug('Cleaned up old temporary STT files');
     } catch (error) {
@@ -189,20 +198,21 @@ export class EnhancedSpeechToTextService {
    * Clean up files in a directory that are older than the expiry time
    */
   private async cleanupDirectory(directory: string, expiryTime: number): Promise<void> {
-    const files = await readdir(directory);
+    const entries = await readdir(directory, { withFileTypes: true });
     
-    for (const file of files) {
-      const filePath = path.join(directory, file);
-      const fileStat = await stat(filePath);
-      
-      if (fileStat.isFile() && fileStat.mtimeMs < expiryTime) {
-        try {
-          fs.unlinkSync(filePath);
-        } catch (error) {
-          logger.error(`Failed to delete temp file ${filePath}: ${error.message}`);
+    // Only regular files need a stat; check and delete them concurrently
+    await Promise.all(entries.filter(entry => entry.isFile()).map(async (entry) => {
+      const filePath = path.join(directory, entry.name);
+      
+      try {
+        const fileStat = await stat(filePath);
+        if (fileStat.mtimeMs < expiryTime) {
+          await fs.promises.unlink(filePath);
         }
+      } catch (error) {
+        logger.error(`Failed to delete temp file ${filePath}: ${error.message}`);
       }
-    }
+    }));
   }
 
   /**
@@ -324,11 +334,7 @@ export class EnhancedSpeechToTextService {
       
       const latency = testResult.latency || (Date.now() - startTime);
       
-      this.networkMetrics.latencies.push(latency);
-      // Keep only the last 100 latency measurements
-      if (this.networkMetrics.latencies.length > 100) {
-        this.networkMetrics.latencies.shift();
-      }
+      this.recordLatency(latency);
       
       this.lastPingTime = now;
       logger.debug(`Deepgram API ping successful, latency: ${latency}ms`);
@@ -504,10 +510,7 @@ export class EnhancedSpeechToTextService {
       
       // Calculate latency
       const latency = Date.now() - startTime;
-      this.networkMetrics.latencies.push(latency);
-      if (this.networkMetrics.latencies.length > 100) {
-        this.networkMetrics.latencies.shift();
-      }
+      this.recordLatency(latency);
       
       logger.info(`Deepgram transcription completed in ${latency}ms`);
       
@@ -668,10 +671,7 @@ export class EnhancedSpeechToTextService {
         // Handle close event
         deepgramLive.addListener('close', async () => {
           const latency = Date.now() - startTime;
-          this.networkMetrics.latencies.push(latency);
-          if (this.networkMetrics.latencies.length > 100) {
-            this.networkMetrics.latencies.shift();
-          }
+          this.recordLatency(latency);
           
           // Calculate streaming metrics
           const processingTime = firstChunkTime ? (Date.now() - firstChunkTime) : 0;
@@ -823,12 +823,27 @@ export class EnhancedSpeechToTextService {
     }
   }
 
+  /**
+   * Record a latency measurement, overwriting the oldest once the window is full
+   */
+  private recordLatency(latency: number): void {
+    const metrics = this.networkMetrics;
+    if (metrics.latencyCount === EnhancedSpeechToTextService.LATENCY_WINDOW) {
+      metrics.latencySum -= metrics.latencies[metrics.latencyIndex];
+    } else {
+      metrics.latencyCount++;
+    }
+    metrics.latencies[metrics.latencyIndex] = latency;
+    metrics.latencySum += latency;
+    metrics.latencyIndex = (metrics.latencyIndex + 1) % EnhancedSpeechToTextService.LATENCY_WINDOW;
+  }
+
   /**
    * Get network metrics for monitoring
    */
   public getNetworkMetrics(): any {
-    const avgLatency = this.networkMetrics.latencies.length > 0 
-      ? this.networkMetrics.latencies.reduce((a, b) => a + b, 0) / this.networkMetrics.latencies.length 
+    const avgLatency = this.networkMetrics.latencyCount > 0 
+      ? this.networkMetrics.latencySum / this.networkMetrics.latencyCount 
       : 0;
       
     return {
@@ -2,6 +2,7 @@
 import axios from 'axios';
 import logger from '../utils/logger';
 import { getErrorMessage } from '../utils/logger';
+import { keepAliveHttpsAgent } from '../utils/httpAgent';
 import mongoose from 'mongoose';
 import { v4 as uuidv4 } from 'uuid';
 import { 
@@ -397,7 +398,8 @@ export class EnhancedVoiceAIService {
             'xi-api-key': this.elevenLabsApiKey,
             'Content-Type': 'application/json'
           },
-          responseType: 'arraybuffer'
+          responseType: 'arraybuffer',
+          httpsAgent: keepAliveHttpsAgent
         }
       );
 
@@ -1456,4 +1458,20 @@ Current call details:
   }
 }
 
-// Export class only - instances are created with proper parameters elsewhere
+// Shared instance for request handlers, so each webhook or stream doesn't
+// rebuild the ElevenLabs clients and re-query the LLM configuration
+let sharedVoiceAIService: EnhancedVoiceAIService | null = null;
+
+export function getSharedVoiceAIService(elevenLabsApiKey: string): EnhancedVoiceAIService {
+  if (!sharedVoiceAIService || sharedVoiceAIService.getElevenLabsApiKey() !== elevenLabsApiKey) {
+    sharedVoiceAIService = new EnhancedVoiceAIService(elevenLabsApiKey);
+  }
+  return sharedVoiceAIService;
+}
+
+/**
+ * Drop the shared instance so the next request picks up updated configuration
+ */
+export function resetSharedVoiceAIService(): void {
+  sharedVoiceAIService = null;
+}
@@ -2,6 +2,7 @@ import axios from 'axios';
 import { logger } from '../index';
 import { Deepgram } from '@deepgram/sdk';
 import { getErrorMessage } from '../utils/logger';
+import { keepAliveHttpsAgent } from '../utils/httpAgent';
 
 export interface SpeechAnalysis {
   transcript: string;
@@ -134,7 +135,8 @@ export class SpeechAnalysisService {
             headers: {
               'Authorization': `Token ${this.deepgramApiKey}`,
               'Content-Type': 'audio/wav'
-            }
+            },
+            httpsAgent: keepAliveHttpsAgent
           }
         );
         
@@ -177,7 +179,8 @@ export class SpeechAnalysisService {
             headers: {
               'Authorization': `Bearer ${this.openAIApiKey}`,
               'Content-Type': 'multipart/form-data'
-            }
+            },
+            httpsAgent: keepAliveHttpsAgent
           }
         );
 
@@ -240,7 +243,8 @@ export class SpeechAnalysisService {
           headers: {
             'Authorization': `Bearer ${this.openAIApiKey}`,
             'Content-Type': 'application/json'
-          }
+          },
+          httpsAgent: keepAliveHttpsAgent
         }
       );
 
@@ -310,7 +314,8 @@ export class SpeechAnalysisService {
           headers: {
             'Authorization': `Bearer ${this.openAIApiKey}`,
             'Content-Type': 'application/json'
-          }
+          },
+          httpsAgent: keepAliveHttpsAgent
         }
       );
 
@@ -367,7 +372,8 @@ export class SpeechAnalysisService {
           headers: {
             'Authorization': `Bearer ${this.openAIApiKey}`,
             'Content-Type': 'application/json'
-          }
+          },
+          httpsAgent: keepAliveHttpsAgent
         }
       );
 
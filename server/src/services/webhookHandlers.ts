@@ -7,7 +7,7 @@ import Campaign from '../models/Campaign';
 import Configuration from '../models/Configuration';
 import { conversationEngine } from './index';
 import { AdvancedTelephonyService } from './advancedTelephonyService';
-import { EnhancedVoiceAIService } from './enhancedVoiceAIService';
+import { EnhancedVoiceAIService, getSharedVoiceAIService } from './enhancedVoiceAIService';
 import { synthesizeVoiceResponse, processAudioForTwiML , prepareUrlForTwilioPlay } from '../utils/voiceSynthesis';
 import { getPreferredVoiceId } from '../utils/voiceUtils';
 import fs from 'fs';
@@ -53,7 +53,7 @@ export async function handleTwilioVoiceWebhook(req: Request, res: Response): Pro
           // Check for ANY enabled LLM provider, not just OpenAI
           const enabledProvider = config.llmConfig.providers.find(p => p.isEnabled && p.apiKey);
           if (enabledProvider) {
-            const voiceAI = new EnhancedVoiceAIService(
+            const voiceAI = getSharedVoiceAIService(
               config.elevenLabsConfig.apiKey
             );
             
@@ -172,7 +172,7 @@ export async function handleTwilioVoiceWebhook(req: Request, res: Response): Pro
           // Check for ANY enabled LLM provider, not just OpenAI
           const enabledProvider = configuration.llmConfig.providers.find(p => p.isEnabled && p.apiKey);
           if (enabledProvider) {
-            const voiceAI = new EnhancedVoiceAIService(
+            const voiceAI = getSharedVoiceAIService(
               configuration.elevenLabsConfig.apiKey
             );
             
@@ -239,7 +239,7 @@ export async function handleTwilioVoiceWebhook(req: Request, res: Response): Pro
         if (enabledProvider) {
           logger.info(`🔧 ElevenLabs configuration status: ${configuration.elevenLabsConfig.status || 'unknown'}, API key length: ${configuration.elevenLabsConfig.apiKey.length}, using LLM provider: ${enabledProvider.name}`);
           
-          const voiceAI = new EnhancedVoiceAIService(
+          const voiceAI = getSharedVoiceAIService(
             configuration.elevenLabsConfig.apiKey
           );
           
@@ -278,8 +278,9 @@ export async function handleTwilioVoiceWebhook(req: Request, res: Response): Pro
               language: campaign.primaryLanguage === 'hi' ? 'Hindi' : 'English'
             });
             
-            // Check if the file exists and is not empty
-            if (fs.existsSync(speechFilePath) && fs.statSync(speechFilePath).size > 0) {
+            // Check if the file exists and is not empty with a single stat
+            const speechFilePathStat = fs.statSync(speechFilePath, { throwIfNoEntry: false });
+            if (speechFilePathStat && speechFilePathStat.size > 0) {
               // Process audio safely using helper function
               const audioBuffer = fs.readFileSync(speechFilePath);
               const audioResult = await processAudioForTwiML(
@@ -646,7 +647,7 @@ export async function handleTwilioGatherWebhook(req: Request, res: Response): Pr
             if (configuredProvider?.isEnabled && configuredProvider?.apiKey) {
               logger.info(`Using LLM provider '${configuredProvider.name}' for ElevenLabs in gather webhook.`);
               // Initialize ElevenLabs service
-              const voiceAI = new EnhancedVoiceAIService(
+              const voiceAI = getSharedVoiceAIService(
                 config.elevenLabsConfig.apiKey
               );
               
@@ -0,0 +1,7 @@
+import https from 'https';
+
+/**
+ * Shared keep-alive agent for outbound API calls
+ * Reusing sockets avoids a new TCP and TLS handshake on every TTS/STT/LLM request
+ */
+export const keepAliveHttpsAgent = new https.Agent({ keepAlive: true, maxSockets: 50 });
@@ -44,31 +44,32 @@ export class TempFileCleanup {
   /**
    * Clean up temporary files immediately
    */
-  static cleanupTempFiles(baseDir: string = process.cwd()): void {
+  static async cleanupTempFiles(baseDir: string = process.cwd()): Promise<void> {
     try {
-      const files = fs.readdirSync(baseDir);
-      let cleanedCount = 0;
+      const entries = await fs.promises.readdir(baseDir, { withFileTypes: true });
+      const tempFiles = entries.filter(entry => entry.isFile() && this.TEMP_FILE_PATTERN.test(entry.name));
 
-      files.forEach(file => {
-        if (this.TEMP_FILE_PATTERN.test(file)) {
-          const filePath = path.join(baseDir, file);
-          
-          try {
-            const stats = fs.statSync(filePath);
-            const fileAge = Date.now() - stats.mtime.getTime();
-            
-            // Delete files older than MAX_FILE_AGE_MS
-            if (fileAge > this.MAX_FILE_AGE_MS) {
-              fs.unlinkSync(filePath);
-              cleanedCount++;
-              logger.debug(`Cleaned up temp file: ${file} (age: ${Math.round(fileAge / 1000)}s)`);
-            }
-          } catch (error) {
-            logger.warn(`Failed to clean up temp file ${file}:`, error);
+      // Stat and unlink concurrently instead of blocking the event loop file by file
+      const results = await Promise.all(tempFiles.map(async ({ name: file }) => {
+        const filePath = path.join(baseDir, file);
+
+        try {
+          const stats = await fs.promises.stat(filePath);
+          const fileAge = Date.now() - stats.mtime.getTime();
+
+          // Delete files older than MAX_FILE_AGE_MS
+          if (fileAge > this.MAX_FILE_AGE_MS) {
+            await fs.promises.unlink(filePath);
+            logger.debug(`Cleaned up temp file: ${file} (age: ${Math.round(fileAge / 1000)}s)`);
+            return true;
           }
+        } catch (error) {
+          logger.warn(`Failed to clean up temp file ${file}:`, error);
         }
-      });
+        return false;
+      }));
 
+      const cleanedCount = results.filter(Boolean).length;
       if (cleanedCount > 0) {
         logger.info(`Cleaned up ${cleanedCount} temporary MP3 files`);
       }
@@ -1,4 +1,4 @@
-import { EnhancedVoiceAIService } from '../services/enhancedVoiceAIService';
+import { EnhancedVoiceAIService, getSharedVoiceAIService } from '../services/enhancedVoiceAIService';
 import Configuration from '../models/Configuration';
 import Campaign from '../models/Campaign';
 import logger from './logger';
@@ -90,7 +90,7 @@ export async function synthesizeVoiceResponse(
       }
       
       // Initialize voice service with configuration values
-      const voiceAI = new EnhancedVoiceAIService(
+      const voiceAI = getSharedVoiceAIService(
         config.elevenLabsConfig.apiKey
       );
       
@@ -123,8 +123,9 @@ export async function synthesizeVoiceResponse(
           language: language === 'en' ? 'English' : 'Hindi'
         });
         
-        // Check if the file exists and is not empty
-        if (fs.existsSync(speechResponse) && fs.statSync(speechResponse).size > 0) {
+        // Check if the file exists and is not empty with a single stat
+        const speechResponseStat = fs.statSync(speechResponse, { throwIfNoEntry: false });
+        if (speechResponseStat && speechResponseStat.size > 0) {
           logger.debug(`Successfully synthesized speech: ${speechResponse}`);
              // Instead of embedding as base64, upload to Cloudinary
         if (cloudinaryService.isCloudinaryConfigured()) {
@@ -175,7 +176,7 @@ export async function synthesizeVoiceResponse(
       }
     } else {
       // Use provided API keys
-      const voiceAI = new EnhancedVoiceAIService(elevenLabsApiKey);
+      const voiceAI = getSharedVoiceAIService(elevenLabsApiKey);
       
       // Resolve voice ID
       const finalVoiceId = requestedVoiceId ? 
@@ -189,8 +190,9 @@ export async function synthesizeVoiceResponse(
         language: language === 'en' ? 'English' : 'Hindi'
       });
       
-      // Check if the file exists and is not empty
-      if (fs.existsSync(filePath) && fs.statSync(filePath).size > 0) {
+      // Check if the file exists and is not empty with a single stat
+      const filePathStat = fs.statSync(filePath, { throwIfNoEntry: false });
+      if (filePathStat && filePathStat.size > 0) {
         // Instead of embedding as base64, upload to Cloudinary
         if (cloudinaryService.isCloudinaryConfigured()) {
           try {